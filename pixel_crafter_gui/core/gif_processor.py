@@ -1,5 +1,5 @@
 from PIL import Image, ImageSequence
-from core.processor import pixelate_image, add_outline
+from core.processor import pixelate_image, add_outline, upscale_for_preview, downsample_box
 from core.palette import apply_palette_unified
 import os
 
@@ -23,7 +23,7 @@ def process_gif(input_path, output_path, pixel_size, palette_name, custom_colors
             small_w = max(1, w // pixel_size)
             small_h = max(1, h // pixel_size)
             
-            small_frame = frame_rgba.resize((small_w, small_h), resample=Image.BOX)
+            small_frame = downsample_box(frame_rgba, pixel_size, small_w, small_h)
             
             # 3. Apply Palette (core.palette.apply_palette_unified handles RGBA)
             processed_small = apply_palette_unified(small_frame, palette_name, custom_colors, dither,
@@ -35,7 +35,7 @@ def process_gif(input_path, output_path, pixel_size, palette_name, custom_colors
                 processed_small = add_outline(processed_small)
 
             # 5. Upscale back to original size (Nearest Neighbor)
-            processed_final = processed_small.resize((w, h), resample=Image.NEAREST)
+            processed_final = upscale_for_preview(processed_small, (w, h))
             
             # 6. Convert to P mode for GIF optimization
             # We use fallback to 'RGB' then 'P' if needed, or just ADAPTIVE quantize
@@ -1,6 +1,7 @@
 from PIL import Image, ImageEnhance, ImageChops
 import numpy as np
 import colorsys
+import functools
 
 def rgb_to_lab(rgb_arr):
     """
@@ -42,14 +43,23 @@ def rgb_to_lab(rgb_arr):
     
     return np.stack([l, a, b], axis=-1)
 
+@functools.lru_cache(maxsize=32)
+def _palette_lab(palette_colors):
+    """
+    LAB table [N, 3] for a palette given as a tuple of RGB tuples.
+    Cached because the same palette is mapped for every GIF frame and batch image.
+    """
+    pal_lab = rgb_to_lab(np.array(palette_colors).reshape(1, -1, 3)).reshape(-1, 3)
+    pal_lab.flags.writeable = False # Shared between callers
+    return pal_lab
+
 def map_to_palette_lab(img, palette_colors):
     """
     Maps an image to a palette using CIE LAB color space for maximum perceptual accuracy.
     palette_colors: List of RGB tuples [(r,g,b), ...]
     """
-    # 1. Convert palette colors to LAB
-    pal_np = np.array(palette_colors).reshape(1, -1, 3)
-    pal_lab = rgb_to_lab(pal_np).reshape(-1, 3) # [N, 3]
+    # 1. Convert palette colors to LAB (cached per palette)
+    pal_lab = _palette_lab(tuple(tuple(c) for c in palette_colors)) # [N, 3]
     
     # 2. Convert image to LAB
     img_rgb = img.convert("RGB")
@@ -59,17 +69,20 @@ def map_to_palette_lab(img, palette_colors):
     pixels_lab = img_lab.reshape(-1, 3) # [H*W, 3]
     
     # 3. Vectorized Nearest Neighbor in LAB space
-    # (H*W, 1, 3) - (1, N, 3) -> (H*W, N, 3)
+    # |p - c|^2 = |p|^2 - 2 p.c + |c|^2, and |p|^2 is the same for every c,
+    # so argmin over (|c|^2 - 2 p.c) needs one [chunk, 3] x [3, N] product
+    # instead of a [chunk, N, 3] difference array.
     # Using small chunks if image is too large to avoid memory error
     chunk_size = 100000 # Process 100k pixels at a time
     indices = np.zeros(pixels_lab.shape[0], dtype=np.int32)
+    pal_t = np.ascontiguousarray(pal_lab.T, dtype=np.float32) * -2.0 # [3, N]
+    pal_sq = np.sum(pal_lab.astype(np.float32) ** 2, axis=1) # [N]
     
     for i in range(0, pixels_lab.shape[0], chunk_size):
         end = min(i + chunk_size, pixels_lab.shape[0])
-        chunk = pixels_lab[i:end, np.newaxis, :] # [chunk, 1, 3]
-        diffs = chunk - pal_lab[np.newaxis, :, :] # [chunk, N, 3]
-        sq_dists = np.sum(diffs**2, axis=2) # [chunk, N]
-        indices[i:end] = np.argmin(sq_dists, axis=1)
+        scores = pixels_lab[i:end].astype(np.float32, copy=False) @ pal_t # [chunk, N]
+        scores += pal_sq
+        indices[i:end] = np.argmin(scores, axis=1)
         
     # 4. Reconstruct image from palette indices
     result_arr = np.array(palette_colors)[indices].reshape(h, w, 3).astype(np.uint8)
@@ -338,21 +351,22 @@ def extract_geometric_palette(img, color_count=16):
     candidate_rgbs = voxel_rgbs[sorted_indices]
     
     # Fill remaining slots with a diversity check
-    pixels_lab = rgb_to_lab(pixels.reshape(1, -1, 3)).reshape(-1, 3) # Full pixel cloud in LAB
+    # Candidates and the anchors are converted to LAB once; accepted candidates
+    # reuse their row instead of re-converting the whole palette per candidate
+    cand_labs = rgb_to_lab(candidate_rgbs.reshape(1, -1, 3)).reshape(-1, 3)
+    pal_labs = list(rgb_to_lab(np.array(palette).reshape(1, -1, 3)).reshape(-1, 3))
     
     # Threshold for remaining colors
     min_dist_sq = 20.0 ** 2 
     
-    for cand_rgb in candidate_rgbs:
+    for cand_rgb, cand_lab in zip(candidate_rgbs, cand_labs):
         if len(palette) >= color_count: break
         
         # Check distance from already picked colors in LAB space
-        cand_lab = rgb_to_lab(cand_rgb.reshape(1, 1, 3)).reshape(3)
-        pal_lab = rgb_to_lab(np.array(palette).reshape(1, -1, 3)).reshape(-1, 3)
-        
-        dists = np.sum((pal_lab - cand_lab)**2, axis=1)
+        dists = np.sum((np.array(pal_labs).reshape(-1, 3) - cand_lab)**2, axis=1)
         if np.all(dists > min_dist_sq):
             palette.append(cand_rgb)
+            pal_labs.append(cand_lab)
             
     return [tuple(map(int, c)) for c in palette]
 
@@ -3,9 +3,11 @@ import os
 import random
 import math
 import builtins
+import threading
 import torch
 import numpy as np
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from PIL import Image, ImageDraw, ImageFont
 
 class BasePlugin(ABC):
@@ -23,13 +25,36 @@ class BasePlugin(ABC):
         """
         pass
 
+@dataclass(slots=True)
+class PluginInfo:
+    """
+    A loaded plugin. Display fields are resolved from its metadata once at load time.
+    """
+    plugin_id: str
+    name: str
+    version: str
+    description: str
+    enabled: bool
+    metadata: dict
+    plugin_class: type
+    instance: BasePlugin
+    title: str = field(init=False)
+
+    def __post_init__(self):
+        self.title = f"{self.name} v{self.version}"
+
 class PluginEngine:
     """
     Handles discovery, sandboxing, and execution of plugins.
     """
     def __init__(self, plugins_dir):
         self.plugins_dir = plugins_dir
+        self.state_path = os.path.join(plugins_dir, "plugin_state.json")
         self.plugins = {}
+        # Guards self.plugins: toggled from the Tk thread, read by processing threads
+        self._lock = threading.RLock()
+        # Enabled flags persisted from the previous run, applied as plugins are discovered
+        self._saved_state = self._load_state()
         self.hooks = {
             "PRE_PROCESS": [],
             "PRE_DOWNSAMPLE": [],
@@ -105,12 +130,18 @@ class PluginEngine:
                 print(f"No valid BasePlugin class found in {script_path}")
                 return
 
-            self.plugins[plugin_id] = {
-                "metadata": meta,
-                "class": plugin_class,
-                "instance": plugin_class(meta),
-                "enabled": False
-            }
+            info = PluginInfo(
+                plugin_id=plugin_id,
+                name=meta.get("name"),
+                version=meta.get("version"),
+                description=meta.get("description"),
+                enabled=bool(self._saved_state.get(plugin_id, False)),
+                metadata=meta,
+                plugin_class=plugin_class,
+                instance=plugin_class(meta)
+            )
+            with self._lock:
+                self.plugins[plugin_id] = info
             
             for hook in meta.get("hooks", []):
                 if hook in self.hooks:
@@ -120,16 +151,59 @@ class PluginEngine:
         except Exception as e:
             print(f"Failed to load plugin from {folder_path}: {e}")
 
+    def _load_state(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Failed to load plugin state: {e}")
+            return {}
+
+    def save_state(self):
+        """
+        Persists the enabled flag of every plugin. Written to a temp file and renamed
+        so an interrupted write never leaves a truncated state file behind.
+        """
+        state = {p_id: info.enabled for p_id, info in self.snapshot().items()}
+        tmp_path = self.state_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=4)
+            os.replace(tmp_path, self.state_path)
+            self._saved_state = state
+            return True
+        except Exception as e:
+            print(f"Failed to save plugin state: {e}")
+            return False
+
+    def snapshot(self):
+        """Returns a shallow copy of the plugins dict that is safe to iterate."""
+        with self._lock:
+            return dict(self.plugins)
+
+    def set_enabled(self, plugin_id, enabled):
+        """Sets a plugin's enabled flag. Returns False if the plugin is unknown."""
+        with self._lock:
+            info = self.plugins.get(plugin_id)
+            if info is None:
+                return False
+            info.enabled = enabled
+            return True
+
     def execute_hook(self, hook_name, image, params):
         if hook_name not in self.hooks:
             return image
 
         current_image = image
+        plugins = self.snapshot()
         for plugin_id in self.hooks[hook_name]:
-            plugin_data = self.plugins.get(plugin_id)
-            if plugin_data and plugin_data["enabled"]:
+            info = plugins.get(plugin_id)
+            if info and info.enabled:
                 try:
-                    current_image = plugin_data["instance"].run(current_image, params)
+                    current_image = info.instance.run(current_image, params)
                 except Exception as e:
                     print(f"Plugin {plugin_id} failed during {hook_name}: {e}")
             
@@ -102,7 +102,7 @@ def pixelate_image(img, pixel_size, target_width=None, edge_enhance=False, edge_
         small_img = downsample_kmeans_adaptive(img, pixel_size, small_width, small_height)
     else:
         # Standard BOX
-        small_img = img.resize((small_width, small_height), resample=Image.BOX)
+        small_img = downsample_box(img, pixel_size, small_width, small_height)
 
     # [Hook] POST_DOWNSAMPLE
     if plugin_engine:
@@ -112,6 +112,22 @@ def pixelate_image(img, pixel_size, target_width=None, edge_enhance=False, edge_
 
 
 
+# Modes Image.reduce accepts; others raise "image has wrong mode"
+_REDUCE_MODES = frozenset(("L", "LA", "La", "RGB", "RGBA", "RGBa", "RGBX", "CMYK", "YCbCr", "I", "F"))
+
+def downsample_box(img, pixel_size, out_w, out_h):
+    """
+    Block-average downsampling to (out_w, out_h).
+    When the image splits into whole pixel_size blocks and its mode is one
+    Image.reduce handles, Pillow's integer-factor kernel is used. Its output can
+    differ from a BOX resize by rounding (a few levels on low-alpha RGBA blocks).
+    Any other case, e.g. P or I;16 images from plugins, keeps the BOX resize.
+    """
+    w, h = img.size
+    if img.mode in _REDUCE_MODES and out_w * pixel_size == w and out_h * pixel_size == h:
+        return img.reduce(pixel_size)
+    return img.resize((out_w, out_h), resample=Image.BOX)
+
 def downsample_kmeans_adaptive(img, pixel_size, out_w, out_h):
     """
     Hardware-accelerated downsampling using PyTorch. 
@@ -229,8 +245,8 @@ def normalize_image_geometry(img, target_size, strategy="Fit & Pad", bg_color=(0
         canvas = Image.new("RGBA", (tw, th), bg_color)
         ox, oy = (tw - nw) // 2, (th - nh) // 2
         
-        # Use split()[3] if RGBA for proper transparency mask
-        mask = res_scaled.split()[3] if res_scaled.mode == "RGBA" else None
+        # Alpha band as the transparency mask (getchannel avoids split()'s extra band copies)
+        mask = res_scaled.getchannel("A") if res_scaled.mode == "RGBA" else None
         canvas.paste(res_scaled, (ox, oy), mask=mask)
         return canvas
         
@@ -242,7 +258,7 @@ def normalize_image_geometry(img, target_size, strategy="Fit & Pad", bg_color=(0
         # If image is larger, we need to crop it
         # If image is smaller, we just paste it in center (padding)
         # Paste handles both (if ox/oy are negative, it crops)
-        mask = img.split()[3] if img.mode == "RGBA" else None
+        mask = img.getchannel("A") if img.mode == "RGBA" else None
         canvas.paste(img, (ox, oy), mask=mask)
         return canvas
         
@@ -376,6 +392,18 @@ def upscale_for_preview(small_img, original_size):
     """Upscales a small image to a larger size using NEAREST neighbor."""
     return small_img.resize(original_size, resample=Image.NEAREST)
 
+def flatten_alpha(img):
+    """
+    Composites an image onto black and returns it as RGB, for formats
+    without (reliable) alpha such as JPG, BMP and TGA.
+    """
+    if img.mode != "RGBA":
+        return img.convert("RGB")
+    # Black background by default for pixel art; getchannel copies only the alpha band
+    bg = Image.new("RGB", img.size)
+    bg.paste(img, mask=img.getchannel("A"))
+    return bg
+
 def save_image(img, path):
     img.save(path)
 
@@ -7,12 +7,13 @@ import sys
 import json
 import threading
 import time
+import numpy as np
 
 # Import core logic
 from core.processor import (pixelate_image, upscale_for_preview, add_outline, 
                             remove_background, apply_grain_effect, remove_background_ai, 
                             remove_background_interactive, is_directml_supported,
-                            normalize_image_geometry)
+                            normalize_image_geometry, flatten_alpha, downsample_box)
 from core.palette import apply_palette_unified
 from core.project_manager import ProjectManager
 from core.gif_processor import process_gif
@@ -577,6 +578,8 @@ class PixelApp(ctk.CTk):
         self.theme_manager.set_theme(theme_name)
 
     def change_language(self, lang_code):
+        # Re-selecting the active language would only re-run update_ui_text on unchanged text
+        if lang_code == self.locale.current_lang: return
         if self.locale.load_language(lang_code): self.update_ui_text()
 
     def open_plugin_manager(self):
@@ -1184,10 +1187,10 @@ class PixelApp(ctk.CTk):
 
     def toggle_magnifier(self):
         if self.mag_window is None or not self.mag_window.winfo_exists(): self.mag_window = MagnifierWindow(self)
-        else: self.mag_window.focus()
+        else: self.mag_window.show()
 
     def update_magnifier(self, event):
-        if not self.preview_image or not self.canvas_image_id or not (self.mag_window and self.mag_window.winfo_exists()): return
+        if not self.preview_image or not self.canvas_image_id or not (self.mag_window and self.mag_window.winfo_viewable()): return
         cw, ch = self.preview_canvas.winfo_width(), self.preview_canvas.winfo_height()
         iw, ih = self.preview_image.size
         nw, nh = int(iw * self.preview_zoom), int(ih * self.preview_zoom)
@@ -1248,13 +1251,8 @@ class PixelApp(ctk.CTk):
                 
                 # Handle alpha channel for formats that don't support it well (JPG, BMP, TGA)
                 if ext.endswith(('.jpg', '.jpeg', '.bmp', '.tga')):
-                    if final.mode == "RGBA":
-                        # Create background (black by default for pixel art)
-                        bg = Image.new("RGB", final.size, (0, 0, 0))
-                        bg.paste(final, mask=final.split()[3])
-                        final = bg
-                    else:
-                        final = final.convert("RGB")
+                    # Black background by default for pixel art
+                    final = flatten_alpha(final)
                 
                 if ext.endswith('.png'):
                     from PIL.PngImagePlugin import PngInfo
@@ -1479,6 +1477,10 @@ class PixelApp(ctk.CTk):
         if self.image_manager.count() > 0: BatchExportWindow(self, self._start_batch_export_process)
 
     def _start_batch_export_process(self, od, fs, win, ss=False, sep=False, norm_settings=None):
+        # Create the output folder up front so a bad path fails before any image is processed
+        try: os.makedirs(od, exist_ok=True)
+        except OSError as ex:
+            win.log(f"❌ 저장 경로를 만들 수 없습니다: {ex}"); win.btn_start.configure(state="normal"); return
         import concurrent.futures
         from collections import defaultdict
         import math
@@ -1519,7 +1521,7 @@ class PixelApp(ctk.CTk):
                 img = enhance_internal_edges(img, p["edge_sensitivity"])
                 
             sw, sh = max(1, img.size[0] // p["pixel_size"]), max(1, img.size[1] // p["pixel_size"])
-            small = img.resize((sw, sh), resample=Image.BOX)
+            small = downsample_box(img, p["pixel_size"], sw, sh)
             
             # 3. Palette Application
             ch = p["palette_mode"]
@@ -1535,7 +1537,7 @@ class PixelApp(ctk.CTk):
             
             # 4. Upscale back to Original Result Size
             orig_size = e["pil_image"].size
-            base = proc.resize(orig_size, Image.NEAREST)
+            base = upscale_for_preview(proc, orig_size)
             
             # 5. [New Phase 50] Resolution Normalization
             if norm_settings and norm_settings.get("enabled"):
@@ -1555,11 +1557,11 @@ class PixelApp(ctk.CTk):
                 # Re-calculate outline on the potentially normalized base
                 out_small = add_outline(proc)
                 # Ensure outline is upscaled to match normalized base
-                base_for_diff = proc.resize(orig_size, Image.NEAREST)
+                base_for_diff = upscale_for_preview(proc, orig_size)
                 diff = ImageChops.difference(out_small, proc)
-                outline_img = diff.resize(orig_size, Image.NEAREST)
+                outline_img = upscale_for_preview(diff, orig_size)
                 
-                final = out_small.resize(orig_size, Image.NEAREST)
+                final = upscale_for_preview(out_small, orig_size)
                 
                 # Apply same normalization to final and outline if enabled
                 if norm_settings and norm_settings.get("enabled"):
@@ -1583,12 +1585,7 @@ class PixelApp(ctk.CTk):
                 else:
                     # Handle alpha channel for specific formats
                     if ext in ["jpg", "jpeg", "bmp", "tga"]:
-                        if final.mode == "RGBA":
-                            bg = Image.new("RGB", final.size, (0, 0, 0))
-                            bg.paste(final, mask=final.split()[3])
-                            final = bg
-                        else:
-                            final = final.convert("RGB")
+                        final = flatten_alpha(final)
                     
                     save_path = os.path.join(od, f"{bn}_pixel.{ext}")
                     final.save(save_path)
@@ -1675,18 +1672,35 @@ class PixelApp(ctk.CTk):
 class MagnifierWindow(ctk.CTkToplevel):
     def __init__(self, parent):
         super().__init__(parent); self.title("🔍 Pixel Magnifier"); self.geometry("300x380"); self.attributes("-topmost", True); self.parent = parent
-        self.display_label = ctk.CTkLabel(self, text="", width=280, height=280, fg_color="black", corner_radius=10); self.display_label.pack(pady=10, padx=10)
+        # One Tk image and canvas item, created once; update_zoom only pastes new pixels into it
+        self.display_canvas = ctk.CTkCanvas(self, width=280, height=280, bg="black", highlightthickness=0); self.display_canvas.pack(pady=10, padx=10)
+        self.tk_zoom = ImageTk.PhotoImage(Image.new("RGBA", (280, 280))); self.display_canvas.create_image(0, 0, anchor="nw", image=self.tk_zoom)
         f = ctk.CTkFrame(self, fg_color="transparent"); f.pack(pady=5, fill="x", padx=10)
         ctk.CTkButton(f, text="-", width=40, command=self.zoom_out).pack(side="left", padx=5)
         self.label_zoom = ctk.CTkLabel(f, text=f"{self.parent.mag_zoom}x", font=("Arial", 16, "bold")); self.label_zoom.pack(side="left", expand=True)
         ctk.CTkButton(f, text="+", width=40, command=self.zoom_in).pack(side="left", padx=5)
+        # Closing only hides the window so reopening skips widget construction
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+        # Output pixel -> crop row/column lookups (NEAREST sampling), rebuilt only when the crop size changes
+        self._rep_key = None; self._rep_ys = self._rep_xs = None
+    def show(self): self.deiconify(); self.lift(); self.focus()
+    @staticmethod
+    def _nearest_idx(n):
+        # Source indices resize(NEAREST) picks for n -> 280: Pillow starts at half a step and adds the step per pixel in float64
+        steps = np.full(280, n / 280); steps[0] *= 0.5
+        return np.cumsum(steps).astype(np.intp)
     def zoom_in(self):
         if self.parent.mag_zoom < 16: self.parent.mag_zoom += 1; self.label_zoom.configure(text=f"{self.parent.mag_zoom}x")
     def zoom_out(self):
         if self.parent.mag_zoom > 2: self.parent.mag_zoom -= 1; self.label_zoom.configure(text=f"{self.parent.mag_zoom}x")
     def update_zoom(self, img, pos, z):
         sz = max(1, int(280 / z)); sx, sy = pos; l, t = max(0, sx - sz // 2), max(0, sy - sz // 2); r, b = min(img.size[0], l + sz), min(img.size[1], t + sz)
-        crop = img.crop((l, t, r, b)).resize((280, 280), Image.NEAREST); ci = ctk.CTkImage(light_image=crop, dark_image=crop, size=(280, 280))
-        self.display_label.configure(image=ci, text=""); self.display_label.image = ci
+        cw, ch = r - l, b - t
+        if self._rep_key != (cw, ch):
+            self._rep_xs = self._nearest_idx(cw)[np.newaxis, :]; self._rep_ys = self._nearest_idx(ch)[:, np.newaxis]; self._rep_key = (cw, ch)
+        # Only the visible region leaves PIL; the nearest-neighbor upscale is one fancy-index
+        view = np.asarray(img.crop((l, t, r, b)).convert("RGBA"))
+        zoomed = Image.frombuffer("RGBA", (280, 280), np.ascontiguousarray(view[self._rep_ys, self._rep_xs]), "raw", "RGBA", 0, 1)
+        self.tk_zoom.paste(zoomed)
 
 if __name__ == "__main__": app = PixelApp(); app.mainloop()
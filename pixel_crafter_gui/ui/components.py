@@ -1,10 +1,59 @@
 import customtkinter as ctk
 from tkinter import filedialog
 import json
-import colorsys
+import os
+import sys
+import subprocess
+import collections
+import functools
+import logging
+import threading
+import numpy as np
+from dataclasses import dataclass
 from PIL import Image, ImageTk, ImageDraw, ImageFont
 from core.palette_parser import PaletteParser
 
+log = logging.getLogger(__name__)
+
+# Opens a folder in the platform's file explorer
+if sys.platform == "win32":
+    _OPEN = os.startfile
+else:
+    _OPEN = lambda path: subprocess.Popen(["open" if sys.platform == "darwin" else "xdg-open", path])
+
+# Resolution normalization strategies offered by ResolutionSettingsWindow
+_UPSCALE_STRATEGIES = ("Stretch", "Pad")
+_DOWNSCALE_STRATEGIES = ("Center Crop", "Fit & Pad", "Compress")
+
+def _hsv2rgb(h, s, v):
+    """
+    HSV -> RGB with all components in 0-1. Same result as colorsys.hsv_to_rgb,
+    inlined for the picker's per-motion-event handlers.
+    """
+    i = int(h * 6.0)
+    f = h * 6.0 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i %= 6
+    if i == 0: return v, t, p
+    if i == 1: return q, v, p
+    if i == 2: return p, v, t
+    if i == 3: return p, q, v
+    if i == 4: return t, p, v
+    return v, p, q
+
+# Per-sextant (r, g, b) picks from the (v, t, p, q) HSV intermediates
+_SV_ORDER = ((0, 1, 2), (3, 0, 2), (2, 0, 1), (2, 3, 0), (1, 2, 0), (0, 2, 3))
+
+# Two-digit hex for every channel value; hex strings are built per motion event
+_HEX = ["%02x" % v for v in range(256)]
+
+def _rgb_to_hex(rgb):
+    """(r, g, b) ints in 0-255 -> '#rrggbb'."""
+    r, g, b = rgb
+    return "#" + _HEX[r] + _HEX[g] + _HEX[b]
+
 class IntSpinbox(ctk.CTkFrame):
     def __init__(self, *args, width=100, height=32, step_size=1, from_=0, to=256, command=None, **kwargs):
         super().__init__(*args, width=width, height=height, **kwargs)
@@ -144,6 +193,11 @@ class PaletteInspector(ctk.CTkFrame):
         self.colors = []
         self.click_callback = click_callback
         self.canvas.bind("<Button-1>", self.on_click)
+        # Whole strip is one PhotoImage shown through a single canvas item.
+        # Both it and the pixel buffer are reused while the canvas size is unchanged.
+        self._tk_img = None
+        self._img_id = None
+        self._strip_buf = None
 
     def on_click(self, event):
         if not self.colors or not self.click_callback:
@@ -154,8 +208,8 @@ class PaletteInspector(ctk.CTkFrame):
         count = len(display_colors)
         if count == 0: return
 
-        slot_w = w / count
-        index = int(event.x // slot_w)
+        # Inverse of update_colors' integer edges: slot i spans [i * w // count, (i + 1) * w // count)
+        index = ((int(event.x) + 1) * count - 1) // w
         
         if 0 <= index < count:
             self.click_callback(index, self.colors[index])
@@ -164,10 +218,13 @@ class PaletteInspector(ctk.CTkFrame):
         """
         Updates the visualization with a list of RGB tuples (0-255).
         """
+        if colors == self.colors:
+            return
         self.colors = colors
-        self.canvas.delete("all")
         
         if not colors:
+            if self._img_id is not None:
+                self.canvas.itemconfigure(self._img_id, state="hidden")
             return
 
         w = self.canvas.winfo_width()
@@ -175,6 +232,7 @@ class PaletteInspector(ctk.CTkFrame):
         # Use initial width if not yet rendered to avoid jitter
         if w <= 1: w = self.cget("width")
         if h <= 1: h = self.cget("height")
+        w, h = int(w), int(h)
         
         # We want to show up to 16 colors. 
         # If more, truncate. If less, just show them.
@@ -182,16 +240,25 @@ class PaletteInspector(ctk.CTkFrame):
         count = len(display_colors)
         if count == 0: return
 
-        slot_w = w / count
-        
+        # Paint the slots into a tiny array and hand Tk a single image
+        arr = self._strip_buf
+        resized = arr is None or arr.shape[:2] != (h, w)
+        if resized:
+            arr = self._strip_buf = np.empty((h, w, 3), dtype=np.uint8)
         for i, color in enumerate(display_colors):
-            hex_c = "#{:02x}{:02x}{:02x}".format(*color)
-            x0 = i * slot_w
-            x1 = (i + 1) * slot_w
-            self.canvas.create_rectangle(x0, 0, x1, h, fill=hex_c, outline="", tags="color")
-            
-            # Optional: Add tooltip-like behavior on click or hover? 
-            # For now just visual.
+            # Integer edges: the last slot always ends at w, so no stale buffer columns survive
+            arr[:, i * w // count:(i + 1) * w // count] = color[:3]
+        img = Image.frombuffer("RGB", (w, h), arr, "raw", "RGB", 0, 1)
+        
+        if resized:
+            self._tk_img = ImageTk.PhotoImage(img)
+        else:
+            self._tk_img.paste(img)
+        
+        if self._img_id is None:
+            self._img_id = self.canvas.create_image(0, 0, anchor="nw", image=self._tk_img)
+        else:
+            self.canvas.itemconfigure(self._img_id, image=self._tk_img, state="normal")
 
 def bind_ctk_slider_wheel(slider, precision=0.05):
     """
@@ -236,6 +303,9 @@ def bind_ctk_slider_wheel(slider, precision=0.05):
     slider.bind("<MouseWheel>", on_wheel)
 
 class CustomPaletteWindow(ctk.CTkToplevel):
+    GRADIENT_CACHE_MAX = 4 # Rendered SV gradients kept, keyed by whole-degree hue (~340 KB each)
+    HUE_REDRAW_MS = 16 # At most one gradient redraw per frame while dragging the hue
+
     def __init__(self, parent, current_callback, initial_colors=None, initial_index=0, live_callback=None):
         super().__init__(parent)
         self.title("커스텀 팔레트 설정 (Custom Palette)")
@@ -244,6 +314,7 @@ class CustomPaletteWindow(ctk.CTkToplevel):
         self.parent = parent
         self.current_callback = current_callback
         self.live_callback = live_callback
+        self._last_live_sent = None # Last palette passed to live_callback
         
         # Modal behavior
         self.transient(parent)
@@ -260,6 +331,9 @@ class CustomPaletteWindow(ctk.CTkToplevel):
         self.bit_mode = ctk.StringVar(value="4bit")
         self.current_slot_index = initial_index
         self.current_h = 0.0
+        # Pure hue color for current_h, shared by the hue label and the pointer
+        self._hue_rgb = (255, 0, 0)
+        self._hue_hex = "#ff0000"
         self.current_s = 1.0
         self.current_v = 1.0
 
@@ -290,6 +364,15 @@ class CustomPaletteWindow(ctk.CTkToplevel):
         self.slots_container = ctk.CTkFrame(self.slot_frame, fg_color="transparent")
         self.slots_container.pack(pady=10, padx=10)
         
+        # All 16 slot buttons are built once; init_slots only shows/recolors them.
+        # self.slots is the visible subset for the current bit mode.
+        self._slot_pool = []
+        for idx in range(16):
+            # Reduced size: 32x32 (~20% reduction from 40)
+            slot = ctk.CTkButton(self.slots_container, text="", width=32, height=32, border_width=2, 
+                                  border_color="#444", fg_color="black", hover_color="#333",
+                                  command=lambda i=idx: self.select_slot(i))
+            self._slot_pool.append(slot)
         self.slots = []
         
         self.btn_add_color = ctk.CTkButton(self.left_sidebar, text="현재 색상을 슬롯에 추가", command=self.add_current_color, 
@@ -322,6 +405,22 @@ class CustomPaletteWindow(ctk.CTkToplevel):
         self.sv_canvas.bind("<B1-Motion>", self.on_sv_click)
         self.sv_canvas.bind("<Button-1>", self.on_sv_click)
         self.sv_canvas.bind("<Motion>", self.on_sv_hover)
+        self._last_hover_xy = (-1, -1)
+        # Reused per redraw: float scratch for one channel and the uint8 RGB output
+        self._grad_scratch = np.empty((self.canvas_size, self.canvas_size), dtype=np.float32)
+        self._grad_buf = np.empty((self.canvas_size, self.canvas_size, 3), dtype=np.uint8)
+        # LRU of hue bucket -> rendered RGB bytes
+        self._gradient_cache = collections.OrderedDict()
+        # One persistent PhotoImage and canvas item; redraws paste into them in place
+        self._grad_pil = Image.new("RGB", (self.canvas_size, self.canvas_size))
+        self.tk_gradient = ImageTk.PhotoImage(self._grad_pil)
+        self._gradient_img_id = self.sv_canvas.create_image(0, 0, anchor="nw", image=self.tk_gradient)
+        self._hue_redraw_id = None
+        # Set when a hue redraw was skipped while the canvas was hidden; replayed once the
+        # window is mapped again (Toplevel <Map> also sees the canvas's own Map events)
+        self._pending_redraw = False
+        self.bind("<Map>", self._on_sv_visible)
+        self.sv_canvas.bind("<Visibility>", self._on_sv_visible)
 
         # Hue Pointer Area
         self.hue_pointer_frame = ctk.CTkFrame(self.picker_frame, fg_color="transparent")
@@ -329,6 +428,13 @@ class CustomPaletteWindow(ctk.CTkToplevel):
         
         self.hue_pointer_canvas = ctk.CTkCanvas(self.hue_pointer_frame, height=20, highlightthickness=0, bg="#2b2b2b")
         self.hue_pointer_canvas.pack(fill="x")
+        # Hue spectrum under the pointer, rendered once per canvas width
+        self._hue_strip_img = None
+        self._hue_strip_id = None
+        self._hue_strip_w = 0
+        self.hue_pointer_canvas.bind("<Configure>", self._build_hue_strip)
+        # ▼ pointer polygon, created once and moved/recolored by update_hue_pointer
+        self._hue_ptr_id = self.hue_pointer_canvas.create_polygon(0, 0, 0, 0, 0, 0, fill="#ff0000", outline="white", width=1)
         
         self.hue_slider = ctk.CTkSlider(self.picker_frame, from_=0, to=1, command=self.on_hue_change, height=15)
         self.hue_slider.set(0)
@@ -380,8 +486,7 @@ class CustomPaletteWindow(ctk.CTkToplevel):
         self.destroy()
 
     def update_hue_pointer(self, *args):
-        self.hue_pointer_canvas.delete("ptr")
-        val = self.hue_slider.get()
+        val = self.current_h
         
         # Actual track width calculation
         total_w = self.hue_pointer_canvas.winfo_width()
@@ -395,46 +500,55 @@ class CustomPaletteWindow(ctk.CTkToplevel):
         track_w = total_w - (2 * margin)
         handle_x = margin + (val * track_w)
         
-        # Current Hue color
-        r, g, b = colorsys.hsv_to_rgb(val, 1, 1)
-        hex_c = "#{:02x}{:02x}{:02x}".format(int(r*255), int(g*255), int(b*255))
-        
-        # Draw ▼ Triangle
-        points = [handle_x - 7, 0, handle_x + 7, 0, handle_x, 15]
-        self.hue_pointer_canvas.create_polygon(points, fill=hex_c, outline="white", width=1, tags="ptr")
+        # Move ▼ Triangle
+        self.hue_pointer_canvas.coords(self._hue_ptr_id, handle_x - 7, 0, handle_x + 7, 0, handle_x, 15)
+        self.hue_pointer_canvas.itemconfigure(self._hue_ptr_id, fill=self._hue_hex)
+
+    def _build_hue_strip(self, event=None):
+        total_w = self.hue_pointer_canvas.winfo_width()
+        if total_w <= 1 or total_w == self._hue_strip_w:
+            return
+        self._hue_strip_w = total_w
+        
+        # Same track margin as update_hue_pointer so the spectrum lines up with the handle
+        margin = 6
+        track_w = max(1, total_w - (2 * margin))
+        
+        # Fully saturated HSV -> RGB as piecewise-linear ramps, vectorized over the width
+        h6 = np.linspace(0, 6, track_w)
+        rgb = np.empty((1, track_w, 3))
+        rgb[0, :, 0] = np.clip(np.abs(h6 - 3) - 1, 0, 1)
+        rgb[0, :, 1] = np.clip(2 - np.abs(h6 - 2), 0, 1)
+        rgb[0, :, 2] = np.clip(2 - np.abs(h6 - 4), 0, 1)
+        arr = np.ascontiguousarray(np.repeat((rgb * 255).astype(np.uint8), 4, axis=0))
+        
+        img = Image.frombuffer("RGB", (track_w, 4), arr, "raw", "RGB", 0, 1)
+        self._hue_strip_img = ImageTk.PhotoImage(img)
+        if self._hue_strip_id is None:
+            self._hue_strip_id = self.hue_pointer_canvas.create_image(margin, 16, anchor="nw", image=self._hue_strip_img)
+        else:
+            self.hue_pointer_canvas.itemconfigure(self._hue_strip_id, image=self._hue_strip_img)
 
     def init_slots(self):
-        for s in self.slots: s.destroy()
-        self.slots = []
-        
         mode = self.bit_mode.get()
         if mode == "2bit": 
-            rows, cols = 4, 1
+            cols = 1
             max_slots = 4
         elif mode == "4bit": 
-            rows, cols = 8, 2
+            cols = 2
             max_slots = 16
         else: return
 
-        for r in range(rows):
-            for c in range(cols):
-                # Reduced size: 32x32 (~20% reduction from 40)
-                # Reduced padding: 1.5 -> 1
-                slot = ctk.CTkButton(self.slots_container, text="", width=32, height=32, border_width=2, 
-                                      border_color="#444", fg_color="black", hover_color="#333")
-                slot.grid(row=r, column=c, padx=1, pady=1)
-                idx = len(self.slots)
-                
-                # Safety check
-                if idx >= max_slots: 
-                    slot.destroy()
-                    continue
+        for slot in self._slot_pool[max_slots:]:
+            slot.grid_remove()
 
-                # Map logical index: persistent_colors[idx]
-                rgb = self.persistent_colors[idx]
-                hex_c = "#{:02x}{:02x}{:02x}".format(*rgb)
-                slot.configure(fg_color=hex_c, command=lambda i=idx: self.select_slot(i))
-                self.slots.append(slot)
+        self.slots = self._slot_pool[:max_slots]
+        for idx, slot in enumerate(self.slots):
+            r, c = divmod(idx, cols)
+            # Reduced padding: 1.5 -> 1
+            slot.grid(row=r, column=c, padx=1, pady=1)
+            # Map logical index: persistent_colors[idx]
+            slot.configure(fg_color=_rgb_to_hex(self.persistent_colors[idx]))
         
         # Keep selection valid if it was outside new range
         if self.current_slot_index >= len(self.slots):
@@ -458,58 +572,80 @@ class CustomPaletteWindow(ctk.CTkToplevel):
             self.init_slots()
 
     def draw_sv_gradient(self):
+        self._pending_redraw = False
+        
+        key = int(self.current_h * 360)
+        cached = self._gradient_cache.get(key)
+        if cached is not None:
+            self._gradient_cache.move_to_end(key)
+            self._grad_pil.frombytes(cached)
+            self.tk_gradient.paste(self._grad_pil)
+            return
+
         # High-performance gradient drawing using NumPy vectorization
         size = self.canvas_size
-        import numpy as np
-        
-        # Create S and V grids
-        s_coords = np.linspace(0, 1, size)
-        v_coords = np.linspace(1, 0, size)
-        s_grid, v_grid = np.meshgrid(s_coords, v_coords)
         
-        h = self.current_h
+        # S varies along x, V along y; broadcasting stands in for a full meshgrid.
+        # float32 is plenty for 8-bit output and halves the working set.
+        s_grid = np.linspace(0, 1, size, dtype=np.float32)[np.newaxis, :]
+        v_grid = np.linspace(1, 0, size, dtype=np.float32)[:, np.newaxis]
         
-        # HSV to RGB Conversion (Vectorized)
-        i = (h * 6.0).astype(int) if isinstance(h, np.ndarray) else int(h * 6.0)
-        f = (h * 6.0) - i
+        # Hue is a single scalar per redraw, so exactly one sextant is active
+        h6 = self.current_h * 6.0
+        i = int(h6)
+        f = h6 - i
+        i = i % 6
         p = v_grid * (1.0 - s_grid)
         q = v_grid * (1.0 - s_grid * f)
         t = v_grid * (1.0 - s_grid * (1.0 - f))
-        i = i % 6
-        
-        rgb = np.zeros((size, size, 3))
         
-        mask0 = (i == 0)
-        mask1 = (i == 1)
-        mask2 = (i == 2)
-        mask3 = (i == 3)
-        mask4 = (i == 4)
-        mask5 = (i == 5)
+        sources = (v_grid, t, p, q)
         
-        rgb[mask0] = np.stack([v_grid[mask0], t[mask0], p[mask0]], axis=-1)
-        rgb[mask1] = np.stack([q[mask1], v_grid[mask1], p[mask1]], axis=-1)
-        rgb[mask2] = np.stack([p[mask2], v_grid[mask2], t[mask2]], axis=-1)
-        rgb[mask3] = np.stack([p[mask3], q[mask3], v_grid[mask3]], axis=-1)
-        rgb[mask4] = np.stack([t[mask4], p[mask4], v_grid[mask4]], axis=-1)
-        rgb[mask5] = np.stack([v_grid[mask5], p[mask5], q[mask5]], axis=-1)
+        # Scale each channel into the scratch buffer and cast straight into the
+        # preallocated uint8 image, so no full-size float RGB array is built
+        scratch = self._grad_scratch
+        for c, k in enumerate(_SV_ORDER[i]):
+            np.multiply(sources[k], 255, out=scratch)
+            self._grad_buf[..., c] = scratch
         
-        img_arr = (rgb * 255).astype(np.uint8)
-        img = Image.fromarray(img_arr)
+        # Wraps the buffer without copying; paste() copies the pixels into the Tk image
+        img = Image.frombuffer("RGB", (size, size), self._grad_buf, "raw", "RGB", 0, 1)
+        self.tk_gradient.paste(img)
         
-        self.tk_gradient = ImageTk.PhotoImage(img)
-        self.sv_canvas.create_image(0, 0, anchor="nw", image=self.tk_gradient)
+        self._gradient_cache[key] = self._grad_buf.tobytes()
+        if len(self._gradient_cache) > self.GRADIENT_CACHE_MAX:
+            self._gradient_cache.popitem(last=False)
+
+    def _on_sv_visible(self, event=None):
+        if self._pending_redraw and self.sv_canvas.winfo_viewable():
+            self.draw_sv_gradient()
 
     def on_hue_change(self, val):
         self.current_h = float(val)
         # Update Hue Hex Label
-        r, g, b = colorsys.hsv_to_rgb(self.current_h, 1, 1)
-        hex_c = "#{:02x}{:02x}{:02x}".format(int(r*255), int(g*255), int(b*255))
-        self.hue_hex_label.configure(text=f"Hue Hex: {hex_c.upper()}")
+        r, g, b = _hsv2rgb(self.current_h, 1, 1)
+        self._hue_rgb = (int(r*255), int(g*255), int(b*255))
+        self._hue_hex = _rgb_to_hex(self._hue_rgb)
+        self.hue_hex_label.configure(text=f"Hue Hex: {self._hue_hex.upper()}")
         
         self.update_hue_pointer()
-        self.draw_sv_gradient()
+        self._schedule_gradient_redraw()
         self.update_current_color()
 
+    def _schedule_gradient_redraw(self):
+        # current_h is always up to date, so the pending redraw renders the latest hue
+        if self._hue_redraw_id is not None:
+            return
+        self._hue_redraw_id = self.after(self.HUE_REDRAW_MS, self._do_gradient_redraw)
+
+    def _do_gradient_redraw(self):
+        self._hue_redraw_id = None
+        # Hidden (minimized/covered) picker: defer until it is shown again
+        if not self.sv_canvas.winfo_viewable():
+            self._pending_redraw = True
+            return
+        self.draw_sv_gradient()
+
     def on_sv_click(self, event):
         size = self.canvas_size
         self.current_s = max(0, min(1, event.x / size))
@@ -517,38 +653,50 @@ class CustomPaletteWindow(ctk.CTkToplevel):
         self.update_current_color()
 
     def on_sv_hover(self, event):
+        xy = (event.x, event.y)
+        if xy == self._last_hover_xy or not self.winfo_viewable():
+            return
+        self._last_hover_xy = xy
         size = self.canvas_size
         s = max(0, min(1, event.x / size))
         v = max(0, min(1, 1 - (event.y / size)))
-        r, g, b = colorsys.hsv_to_rgb(self.current_h, s, v)
+        r, g, b = _hsv2rgb(self.current_h, s, v)
         rgb = (int(r*255), int(g*255), int(b*255))
-        hex_color = "#{:02x}{:02x}{:02x}".format(*rgb)
+        hex_color = _rgb_to_hex(rgb)
         self.cursor_hex_label.configure(text=f"Cursor: {hex_color.upper()}")
 
     def update_current_color(self):
-        r, g, b = colorsys.hsv_to_rgb(self.current_h, self.current_s, self.current_v)
+        r, g, b = _hsv2rgb(self.current_h, self.current_s, self.current_v)
         rgb = (int(r*255), int(g*255), int(b*255))
-        hex_color = "#{:02x}{:02x}{:02x}".format(*rgb)
+        hex_color = _rgb_to_hex(rgb)
         self.current_color_preview.configure(fg_color=hex_color)
         self.hex_label.configure(text=f"Current: {hex_color.upper()}")
 
     def add_current_color(self):
-        r, g, b = colorsys.hsv_to_rgb(self.current_h, self.current_s, self.current_v)
+        r, g, b = _hsv2rgb(self.current_h, self.current_s, self.current_v)
         rgb = (int(r*255), int(g*255), int(b*255))
-        hex_color = "#{:02x}{:02x}{:02x}".format(*rgb)
+        hex_color = _rgb_to_hex(rgb)
         
         # Update persistent storage
         self.persistent_colors[self.current_slot_index] = rgb
         self.slots[self.current_slot_index].configure(fg_color=hex_color)
         
         # Live Update
-        if self.live_callback:
-            self.live_callback(self.persistent_colors[:16])
+        self._send_live_update()
 
         # Auto-advance
         if self.current_slot_index < len(self.slots) - 1:
             self.select_slot(self.current_slot_index + 1)
 
+    def _send_live_update(self):
+        """Forwards the palette to live_callback unless it matches what was last sent."""
+        if not self.live_callback:
+            return
+        colors = self.persistent_colors[:16]
+        if colors != self._last_live_sent:
+            self._last_live_sent = colors
+            self.live_callback(colors)
+
     def apply_to_main(self):
         mode = self.bit_mode.get()
         if mode == "16bit":
@@ -586,18 +734,33 @@ class CustomPaletteWindow(ctk.CTkToplevel):
     def extract_palette_from_image(self):
         # Access parent's image path
         if hasattr(self.parent, 'original_image_path') and self.parent.original_image_path:
-            try:
-                img = Image.open(self.parent.original_image_path)
-                mode = self.bit_mode.get()
-                count = 4 if mode == "2bit" else 16
-                colors = PaletteParser.extract_from_image(img, max_colors=count)
-                if colors:
-                    self.apply_imported_colors(colors)
-            except Exception as e:
-                print(f"Failed to extract colors: {e}")
+            path = self.parent.original_image_path
+            mode = self.bit_mode.get()
+            count = 4 if mode == "2bit" else 16
+            self.btn_extract_img.configure(text="⏳ 색상 추출 중...", state="disabled")
+            # Decoding and quantizing a large source would freeze the window
+            threading.Thread(target=self._extract_palette_worker, args=(path, count), daemon=True).start()
         else:
              print("No image loaded in main app.")
 
+    def _extract_palette_worker(self, path, count):
+        colors = []
+        try:
+            img = Image.open(path)
+            # Quantization cost scales with pixel count; a 512px sample keeps the same dominant colors
+            img.draft("RGB", (512, 512))
+            img.thumbnail((512, 512), Image.BILINEAR)
+            colors = PaletteParser.extract_from_image(img, max_colors=count)
+        except Exception as e:
+            print(f"Failed to extract colors: {e}")
+        self.after(0, self._on_palette_extracted, colors)
+
+    def _on_palette_extracted(self, colors):
+        if not self.winfo_exists(): return
+        self.btn_extract_img.configure(text="🎨 원본 이미지에서 추출", state="normal")
+        if colors:
+            self.apply_imported_colors(colors)
+
     def apply_imported_colors(self, colors):
         # We need to fill up to 16 slots. If fewer colors, we pad with black or repeat? 
         # For now, just fill what we have, leave rest as is or black? 
@@ -618,8 +781,7 @@ class CustomPaletteWindow(ctk.CTkToplevel):
         self.init_slots()
         
         # Live Update
-        if self.live_callback:
-            self.live_callback(self.persistent_colors[:16])
+        self._send_live_update()
 
 class MagnifierWindow(ctk.CTkToplevel):
     """
@@ -693,6 +855,8 @@ class MagnifierWindow(ctk.CTkToplevel):
         self.label_info.configure(text=f"Position: ({cx}, {cy}) | Zoom: x{zoom_level}")
 
 class BatchExportWindow(ctk.CTkToplevel):
+    LOG_FLUSH_MS = 50 # Log lines arriving within this window are written in one insert
+
     def __init__(self, parent, start_callback):
         super().__init__(parent)
         self.title("일괄 저장 설정 (Batch Export Settings)")
@@ -746,6 +910,11 @@ class BatchExportWindow(ctk.CTkToplevel):
             cb = ctk.CTkCheckBox(format_frame, text=fmt, variable=var, command=lambda f=fmt: self.on_format_toggle(f))
             cb.grid(row=row+1, column=col, padx=20, pady=10, sticky="w")
             self.format_checkboxes[fmt] = cb
+        
+        # GIF is exclusive with every other format; keep direct handles for on_format_toggle
+        self._gif_var = self.format_vars["GIF"]
+        self._gif_cb = self.format_checkboxes["GIF"]
+        self._non_gif_pairs = [(self.format_vars[f], self.format_checkboxes[f]) for f in self.format_vars if f != "GIF"]
 
         # Resolution Normalization Section (Task 50.1)
         norm_frame = ctk.CTkFrame(self)
@@ -804,49 +973,55 @@ class BatchExportWindow(ctk.CTkToplevel):
         self.log_text = ctk.CTkTextbox(self, height=120, font=("Consolas", 10))
         self.log_text.pack(pady=10, padx=20, fill="both", expand=True)
 
+        # Log lines waiting to be written to log_text in a single insert
+        self._log_buffer = collections.deque()
+        self._log_flush_pending = False
+        # Latest (current, total) progress; earlier ticks in the same idle cycle are dropped
+        self._progress_latest = None
+
+        # (current, total) last shown in progress_label
+        self._shown_progress = None
+        # Last filled width of the progress bar in pixels, to skip invisible updates
+        self._last_bar_px = -1
+
     def on_format_toggle(self, changed_fmt):
         """Enforces exclusivity: if GIF is selected, others are disabled. vice versa."""
-        is_gif = self.format_vars["GIF"].get()
+        is_gif = self._gif_var.get()
         
         if changed_fmt == "GIF" and is_gif:
             # GIF selected: deselect and disable others
-            for fmt in self.format_vars:
-                if fmt != "GIF":
-                    self.format_vars[fmt].set(False)
-                    self.format_checkboxes[fmt].configure(state="disabled")
+            for var, cb in self._non_gif_pairs:
+                var.set(False)
+                cb.configure(state="disabled")
         elif changed_fmt == "GIF" and not is_gif:
             # GIF deselected: enable others
-            for fmt in self.format_vars:
-                if fmt != "GIF":
-                    self.format_checkboxes[fmt].configure(state="normal")
+            for _, cb in self._non_gif_pairs:
+                cb.configure(state="normal")
         else:
             # One of the other formats was toggled
-            any_others = any(self.format_vars[f].get() for f in self.format_vars if f != "GIF")
-            if any_others:
-                self.format_vars["GIF"].set(False)
-                self.format_checkboxes["GIF"].configure(state="disabled")
+            if any(var.get() for var, _ in self._non_gif_pairs):
+                self._gif_var.set(False)
+                self._gif_cb.configure(state="disabled")
             else:
-                self.format_checkboxes["GIF"].configure(state="normal")
+                self._gif_cb.configure(state="normal")
 
     def open_resolution_settings(self):
         """Opens the new ResolutionSettingsWindow."""
         ResolutionSettingsWindow(self, self.norm_settings)
 
     def browse_dir(self):
-        self.grab_release()
+        # The dialog is modal to this window via parent; no grab hand-off needed
         d = filedialog.askdirectory(parent=self)
-        self.grab_set()
         if d:
             self.entry_dir.delete(0, "end")
             self.entry_dir.insert(0, d)
 
     def open_output_folder(self):
         """Opens the selected output directory in the OS file explorer."""
-        import os
         path = self.entry_dir.get()
-        if path and os.path.exists(path) and os.path.isdir(path):
+        if path and os.path.isdir(path):
             try:
-                os.startfile(path)
+                _OPEN(path)
             except Exception as e:
                 self.log(f"❌ 폴더 열기 실패: {e}")
         else:
@@ -871,20 +1046,46 @@ class BatchExportWindow(ctk.CTkToplevel):
 
     def log(self, message):
         if not self.winfo_exists(): return
+        self._log_buffer.append(message)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.after(self.LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """Writes all buffered log lines with one insert and one scroll."""
+        self._log_flush_pending = False
+        if not self._log_buffer or not self.winfo_exists(): return
+        text = "".join(m + "\n" for m in self._log_buffer)
+        self._log_buffer.clear()
         try:
-            self.log_text.insert("end", message + "\n")
+            self.log_text.insert("end", text)
             self.log_text.see("end")
-            self.update_idletasks()
         except Exception:
             pass
 
     def update_progress(self, current, total):
+        if not self.winfo_exists(): return
+        pending = self._progress_latest is not None
+        self._progress_latest = (current, total)
+        if not pending:
+            self.after_idle(self._flush_progress)
+
+    def _flush_progress(self):
+        """Redraws the bar and label once for the newest queued progress tick."""
+        current, total = self._progress_latest
+        self._progress_latest = None
         if not self.winfo_exists(): return
         try:
             val = current / total
-            self.progress_bar.set(val)
-            self.progress_label.configure(text=f"진행 중: {current} / {total}")
-            self.update_idletasks()
+            bar_w = self.progress_bar.winfo_width() or 200
+            px = int(val * bar_w)
+            if px != self._last_bar_px or current == total:
+                self._last_bar_px = px
+                self.progress_bar.set(val)
+            # Formatted once per flush, and only when the counts moved
+            if (current, total) != self._shown_progress:
+                self._shown_progress = (current, total)
+                self.progress_label.configure(text="진행 중: %d / %d" % (current, total))
         except Exception:
             pass
 
@@ -908,11 +1109,18 @@ class ResolutionSettingsWindow(ctk.CTkToplevel):
         app = parent.parent # PixelApp
         all_images = app.image_manager.get_all()
         
-        ws = [img["pil_image"].size[0] for img in all_images]
-        hs = [img["pil_image"].size[1] for img in all_images]
-        
-        min_w, max_w = min(ws) if ws else 0, max(ws) if ws else 0
-        min_h, max_h = min(hs) if hs else 0, max(hs) if hs else 0
+        # Width/height ranges in a single pass over the inventory
+        min_w = min_h = max_w = max_h = 0
+        for i, img in enumerate(all_images):
+            w, h = img["pil_image"].size
+            if i == 0:
+                min_w = max_w = w
+                min_h = max_h = h
+                continue
+            if w < min_w: min_w = w
+            elif w > max_w: max_w = w
+            if h < min_h: min_h = h
+            elif h > max_h: max_h = h
         
         # UI Header
         self.label_title = ctk.CTkLabel(self, text="", font=("Arial", 18, "bold"))
@@ -964,6 +1172,15 @@ class ResolutionSettingsWindow(ctk.CTkToplevel):
         self.entry_h.pack(side="left", padx=5)
         self.entry_h.insert(0, str(max_h) if not self.settings["enabled"] else str(self.settings["target_h"]))
         
+        # Duration, strategies and buttons are built on the first idle cycle so the
+        # popup maps with its header right away
+        self._deferred_ready = False
+        self.toggle_widgets()
+        self.after_idle(self._build_deferred_ui)
+
+    def _build_deferred_ui(self):
+        if not self.winfo_exists(): return
+        
         # 3. Frame Duration
         self.dur_frame = ctk.CTkFrame(self)
         self.dur_frame.pack(pady=5, padx=20, fill="x")
@@ -991,7 +1208,7 @@ class ResolutionSettingsWindow(ctk.CTkToplevel):
         self.label_up.pack(side="left")
         self.locale.register(self.label_up, "norm_upscale")
         
-        self.opt_upscale = ctk.CTkOptionMenu(up_row, values=["Stretch", "Pad"], height=24)
+        self.opt_upscale = ctk.CTkOptionMenu(up_row, values=list(_UPSCALE_STRATEGIES), height=24)
         self.opt_upscale.pack(side="right", fill="x", expand=True)
         self.opt_upscale.set(self.settings["upscale_strategy"])
         
@@ -1002,13 +1219,10 @@ class ResolutionSettingsWindow(ctk.CTkToplevel):
         self.label_down.pack(side="left")
         self.locale.register(self.label_down, "norm_downscale")
         
-        self.opt_downscale = ctk.CTkOptionMenu(down_row, values=["Center Crop", "Fit & Pad", "Compress"], height=24)
+        self.opt_downscale = ctk.CTkOptionMenu(down_row, values=list(_DOWNSCALE_STRATEGIES), height=24)
         self.opt_downscale.pack(side="right", fill="x", expand=True)
         self.opt_downscale.set(self.settings["downscale_strategy"])
         
-        # Initial State Sync
-        self.toggle_widgets()
-
         # Buttons
         btn_row = ctk.CTkFrame(self, fg_color="transparent")
         btn_row.pack(side="bottom", pady=20, fill="x")
@@ -1021,6 +1235,10 @@ class ResolutionSettingsWindow(ctk.CTkToplevel):
         self.btn_cancel.pack(side="right", padx=20, expand=True)
         self.locale.register(self.btn_cancel, "norm_cancel")
 
+        self._deferred_ready = True
+        # Initial State Sync
+        self.toggle_widgets()
+
     def toggle_widgets(self):
         """Enables or disables all input widgets based on the master switch."""
         state = "normal" if self.var_enabled.get() else "disabled"
@@ -1028,14 +1246,19 @@ class ResolutionSettingsWindow(ctk.CTkToplevel):
         # Update states
         self.entry_w.configure(state=state)
         self.entry_h.configure(state=state)
+        
+        # Visual feedback: Dim frames if disabled
+        frame_color = "gray20" if state == "normal" else "gray15"
+        self.input_frame.configure(fg_color=frame_color)
+        
+        # The remaining sections may not be built yet; _build_deferred_ui syncs them
+        if not self._deferred_ready:
+            return
         self.entry_duration.configure(state=state)
         self.opt_upscale.configure(state=state)
         self.opt_downscale.configure(state=state)
-        
-        # Visual feedback: Dim frames if disabled
-        alpha = 1.0 if self.var_enabled.get() else 0.5
-        for f in [self.input_frame, self.dur_frame, self.strat_frame]:
-            f.configure(fg_color="gray20" if state == "normal" else "gray15")
+        for f in [self.dur_frame, self.strat_frame]:
+            f.configure(fg_color=frame_color)
 
     def apply(self):
         try:
@@ -1063,10 +1286,44 @@ class ResolutionSettingsWindow(ctk.CTkToplevel):
             from tkinter import messagebox
             messagebox.showerror("입력 오류", "유효한 가로/세로 크기를 입력하세요.")
 
+@dataclass
+class PluginRow:
+    """
+    Widgets of one PluginWindow list slot. Slots are pooled and rebound to
+    whichever plugin is scrolled into them.
+    """
+    title_label: ctk.CTkLabel
+    desc_label: ctk.CTkLabel
+    switch: ctk.CTkSwitch
+    slot: int
+    info: object = None # PluginInfo currently shown, None while hidden
+    shown: bool = False
+
+    def show(self):
+        if not self.shown:
+            self.title_label.grid(row=self.slot, column=0, padx=(10, 5), sticky="ew")
+            self.desc_label.grid(row=self.slot, column=1, padx=5, sticky="ew")
+            self.switch.grid(row=self.slot, column=2, padx=(5, 10), sticky="e")
+            self.shown = True
+
+    def hide(self):
+        if self.shown:
+            self.title_label.grid_remove()
+            self.desc_label.grid_remove()
+            self.switch.grid_remove()
+            self.shown = False
+        self.info = None
+
 class PluginWindow(ctk.CTkToplevel):
     """
     A window to manage installed plugins (Enable/Disable).
+    The list is virtualized: only enough rows to fill the viewport are created,
+    and scrolling rebinds them to other plugins instead of building a row per plugin.
     """
+    ROW_HEIGHT = 40
+    CALLBACK_DELAY_MS = 30
+    SAVE_DELAY_MS = 200
+
     def __init__(self, parent, plugin_engine, on_change_callback):
         super().__init__(parent)
         self.title("플러그인 관리 (Plugin Manager)")
@@ -1078,47 +1335,159 @@ class PluginWindow(ctk.CTkToplevel):
         self.transient(parent)
         self.grab_set()
 
+        # Shared font objects; passing tuples would resolve a new font for every row
+        self._f_title = ctk.CTkFont(family="Arial", size=14, weight="bold")
+        self._f_desc = ctk.CTkFont(family="Arial", size=11)
+        self._f_empty = ctk.CTkFont(family="Arial", size=12, slant="italic")
+
         ctk.CTkLabel(self, text="🔌 설치된 플러그인", font=("Arial", 20, "bold")).pack(pady=20)
 
-        self.scroll_frame = ctk.CTkScrollableFrame(self, width=450, height=250)
-        self.scroll_frame.pack(pady=10, padx=20, fill="both", expand=True)
+        self.list_frame = ctk.CTkFrame(self, width=450, height=250)
+        self.list_frame.pack(pady=10, padx=20, fill="both", expand=True)
 
-        self.load_plugins()
+        self.scrollbar = ctk.CTkScrollbar(self.list_frame, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 3), pady=3)
 
-    def load_plugins(self):
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
+        self.rows_frame = ctk.CTkFrame(self.list_frame, fg_color="transparent")
+        self.rows_frame.pack(side="left", fill="both", expand=True)
+        # Size comes from pack; pooled rows must not grow the frame
+        self.rows_frame.grid_propagate(False)
+        self.rows_frame.grid_columnconfigure((0, 1), weight=1)
+        # ROW_HEIGHT in real pixels; minsize and <Configure> heights are unscaled, so both use this
+        self._row_h = round(self.ROW_HEIGHT * ctk.ScalingTracker.get_widget_scaling(self))
 
-        plugins = self.plugin_engine.plugins
-        if not plugins:
-            ctk.CTkLabel(self.scroll_frame, text="설치된 플러그인이 없습니다.", font=("Arial", 12, "italic")).pack(pady=20)
-            return
+        self._items = [] # PluginInfo for every plugin, in engine order
+        self._row_pool = [] # PluginRow slots; slot k shows self._items[self._first + k]
+        self._first = 0
+        self._visible_count = 0
+        self._empty_label = None
+        # Rapid toggles collapse into one on_change_callback per CALLBACK_DELAY_MS
+        self._cb_job = None
+        self._save_job = None
 
-        for p_id, p_data in plugins.items():
-            meta = p_data["metadata"]
-            
-            item_frame = ctk.CTkFrame(self.scroll_frame, fg_color="#2a2a2a", corner_radius=8)
-            item_frame.pack(fill="x", pady=5, padx=5)
-            
-            info_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-            info_frame.pack(side="left", padx=10, pady=10, fill="x", expand=True)
-            
-            ctk.CTkLabel(info_frame, text=f"{meta.get('name')} v{meta.get('version')}", 
-                         font=("Arial", 14, "bold"), anchor="w").pack(fill="x")
-            ctk.CTkLabel(info_frame, text=meta.get("description"), 
-                         font=("Arial", 11), text_color="#aaa", anchor="w").pack(fill="x")
-            
-            # Switch to enable/disable
-            switch_var = ctk.BooleanVar(value=p_data["enabled"])
-            switch = ctk.CTkSwitch(item_frame, text="", variable=switch_var, 
-                                   command=lambda id=p_id, var=switch_var: self.toggle_plugin(id, var))
-            switch.pack(side="right", padx=15)
-
-    def toggle_plugin(self, plugin_id, var):
-        enabled = var.get()
-        if plugin_id in self.plugin_engine.plugins:
-            self.plugin_engine.plugins[plugin_id]["enabled"] = enabled
-            print(f"Plugin {plugin_id} {'enabled' if enabled else 'disabled'}")
-            if self.on_change_callback:
-                self.on_change_callback()
+        self.rows_frame.bind("<Configure>", self._on_list_configure)
+        self.bind("<MouseWheel>", self._on_mousewheel)
+
+        # Let the window draw first, then populate the list
+        self.after(0, self.load_plugins)
+
+    def load_plugins(self):
+        self._items = list(self.plugin_engine.snapshot().values())
+
+        if not self._items:
+            if self._empty_label is None:
+                self._empty_label = ctk.CTkLabel(self.rows_frame, text="설치된 플러그인이 없습니다.", font=self._f_empty)
+                self._empty_label.place(relx=0.5, y=20, anchor="n")
+        elif self._empty_label is not None:
+            self._empty_label.destroy()
+            self._empty_label = None
+
+        self._render()
+
+    def _on_list_configure(self, event):
+        count = max(1, event.height // self._row_h)
+        if count != self._visible_count:
+            self._visible_count = count
+            self._render()
+
+    def _render(self):
+        """Binds pooled rows to the plugins in the current viewport."""
+        n = len(self._items)
+        visible = min(self._visible_count, n)
+        self._first = max(0, min(self._first, n - visible))
+
+        pool_size = min(n, self._visible_count)
+        while len(self._row_pool) < pool_size:
+            self._row_pool.append(self._create_row(len(self._row_pool)))
+
+        for k, row in enumerate(self._row_pool):
+            if k < visible:
+                info = self._items[self._first + k]
+                if row.info is not info:
+                    row.title_label.configure(text=info.title)
+                    row.desc_label.configure(text=info.description)
+                    row.info = info
+                self._sync_switch(row.switch, info.enabled)
+                row.show()
+            else:
+                row.hide()
+
+        if n:
+            self.scrollbar.set(self._first / n, (self._first + visible) / n)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _create_row(self, slot):
+        self.rows_frame.grid_rowconfigure(slot, minsize=self._row_h)
+        title_label = ctk.CTkLabel(self.rows_frame, text="", font=self._f_title, anchor="w")
+        desc_label = ctk.CTkLabel(self.rows_frame, text="", font=self._f_desc, text_color="#aaa", anchor="w")
+        switch = ctk.CTkSwitch(self.rows_frame, text="", width=50)
+        row = PluginRow(title_label, desc_label, switch, slot)
+        # One partial per pooled slot; the plugin it acts on is read from the row at click time
+        switch.configure(command=functools.partial(self._on_row_toggle, row))
+        return row
+
+    def _scroll_to(self, first):
+        first = max(0, min(first, len(self._items) - min(self._visible_count, len(self._items))))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._scroll_to(int(float(value) * len(self._items) + 0.5))
+        elif action == "scroll":
+            step = int(value) * (self._visible_count if unit == "pages" else 1)
+            self._scroll_to(self._first + step)
+
+    def _on_mousewheel(self, event):
+        if str(event.widget).startswith(str(self.scrollbar)):
+            return # CTkScrollbar handles its own wheel events through _on_scrollbar
+        self._scroll_to(self._first + (-1 if event.delta > 0 else 1))
+        return "break"
+
+    def _on_row_toggle(self, row):
+        if row.info is not None:
+            self.toggle_plugin(row.info.plugin_id, row.switch)
+
+    @staticmethod
+    def _sync_switch(switch, enabled):
+        """Mirrors the engine's enabled flag onto a switch, skipping no-op redraws."""
+        if bool(switch.get()) != enabled:
+            if enabled:
+                switch.select()
+            else:
+                switch.deselect()
+
+    def toggle_plugin(self, plugin_id, switch):
+        enabled = bool(switch.get())
+        if self.plugin_engine.set_enabled(plugin_id, enabled):
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Plugin %s %s", plugin_id, "enabled" if enabled else "disabled")
+            # Debounced: a burst of toggles results in a single state write
+            if self._save_job is not None:
+                self.after_cancel(self._save_job)
+            self._save_job = self.after(self.SAVE_DELAY_MS, self._save_plugin_state)
+            if self.on_change_callback and self._cb_job is None:
+                self._cb_job = self.after(self.CALLBACK_DELAY_MS, self._fire_change_callback)
+
+    def _save_plugin_state(self):
+        self._save_job = None
+        self.plugin_engine.save_state()
+
+    def destroy(self):
+        # destroy() drops pending after() jobs; run the debounced save and callback now instead of losing them
+        if self._save_job is not None:
+            self.after_cancel(self._save_job)
+            self._save_plugin_state()
+        cb_pending = self._cb_job is not None
+        if cb_pending:
+            self.after_cancel(self._cb_job)
+        super().destroy()
+        if cb_pending:
+            self._fire_change_callback()
+
+    def _fire_change_callback(self):
+        self._cb_job = None
+        self.on_change_callback()
 
@@ -2,70 +2,98 @@ import json
 import os
 import weakref
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class LocaleManager:
     def __init__(self, assets_dir, default_lang="ko"):
         self.lang_dir = os.path.join(assets_dir, "lang")
         self.current_lang = default_lang
         self.translations = {}
-        self._registered_widgets = [] # List of (weakref(widget), key, prefix, suffix)
+        self._registered_widgets = {} # id(widget) -> (weakref(widget), key, prefix, suffix, configure, last_text)
+        self._lang_cache = {} # lang_code -> parsed translations
+        self._available_langs = None # Scanned once from lang_dir
         self.load_language(default_lang)
 
     def load_language(self, lang_code):
-        file_path = os.path.join(self.lang_dir, f"{lang_code}.json")
-        if os.path.exists(file_path):
+        # Re-selecting the active language (dropdowns can fire twice) changes nothing
+        if lang_code == self.current_lang and self.translations:
+            return True
+        translations = self._lang_cache.get(lang_code)
+        if translations is None:
+            file_path = os.path.join(self.lang_dir, f"{lang_code}.json")
+            if not os.path.exists(file_path):
+                return False
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    self.translations = json.load(f)
-                self.current_lang = lang_code
-                self.refresh_widgets()
-                return True
+                # One read for the whole file, parsed from bytes
+                with open(file_path, "rb") as f:
+                    translations = _json_loads(f.read())
             except Exception as e:
                 print(f"Failed to load language {lang_code}: {e}")
-        return False
+                return False
+            self._lang_cache[lang_code] = translations
+        self.translations = translations
+        self.current_lang = lang_code
+        self.refresh_widgets()
+        return True
 
     def get(self, key, default=None):
         return self.translations.get(key, default if default is not None else key)
 
+    def _get_strict(self, key):
+        """get() without a default, for the widget refresh path."""
+        return self.translations.get(key, key)
+
     def register(self, widget, key, prefix="", suffix=""):
         """Registers a widget to be automatically updated when language changes."""
-        # Use weakref to prevent memory leaks when widgets are destroyed
-        ref = weakref.ref(widget)
-        
-        # Remove existing registration for this widget if it exists
-        self._registered_widgets = [r for r in self._registered_widgets if r[0]() is not None and r[0]() is not widget]
-        
-        self._registered_widgets.append((ref, key, prefix, suffix))
+        wid = id(widget)
+        if wid not in self._registered_widgets:
+            # Drop the entry as soon as the widget is garbage collected
+            weakref.finalize(widget, self._registered_widgets.pop, wid, None)
+        # Use weakref to prevent memory leaks when widgets are destroyed.
+        # configure is looked up on the class, not bound, so the entry holds no strong reference.
+        # Re-registering a widget simply replaces its entry.
+        configure = getattr(type(widget), "configure", None)
         # Initial set
-        self._update_widget(widget, key, prefix, suffix)
+        text = f"{prefix}{self._get_strict(key)}{suffix}"
+        self._update_widget(widget, configure, text)
+        self._registered_widgets[wid] = (weakref.ref(widget), key, prefix, suffix, configure, text)
 
-    def _update_widget(self, widget, key, prefix, suffix):
+    def _update_widget(self, widget, configure, text):
+        if configure is None:
+            return
         try:
-            translated = self.get(key)
-            full_text = f"{prefix}{translated}{suffix}"
-            if hasattr(widget, "configure"):
-                widget.configure(text=full_text)
+            configure(widget, text=text)
         except Exception:
             pass
 
     def refresh_widgets(self):
         """Updates text for all alive registered widgets."""
-        still_alive = []
-        for ref, key, prefix, suffix in self._registered_widgets:
+        # Snapshot: a finalizer may drop entries while we iterate
+        for wid, (ref, key, prefix, suffix, configure, last_text) in list(self._registered_widgets.items()):
             widget = ref()
-            if widget is not None:
-                try:
-                    # Check if widget still exists in tkinter sense
-                    if widget.winfo_exists():
-                        self._update_widget(widget, key, prefix, suffix)
-                        still_alive.append((ref, key, prefix, suffix))
-                except Exception:
-                    pass
-        self._registered_widgets = still_alive
+            if widget is None:
+                continue
+            text = f"{prefix}{self._get_strict(key)}{suffix}"
+            # Strings shared between languages (names, symbols) need no configure round-trip
+            if text == last_text:
+                continue
+            self._update_widget(widget, configure, text)
+            self._registered_widgets[wid] = (ref, key, prefix, suffix, configure, text)
 
     def get_available_languages(self):
-        langs = []
-        if os.path.exists(self.lang_dir):
-            for f in os.listdir(self.lang_dir):
-                if f.endswith(".json"):
-                    langs.append(f.replace(".json", ""))
-        return langs
\ No newline at end of file
+        if self._available_langs is None:
+            langs = []
+            if os.path.isdir(self.lang_dir):
+                with os.scandir(self.lang_dir) as it:
+                    langs = [e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file()]
+            self._available_langs = langs
+        return list(self._available_langs)
+
+    def invalidate_lang_cache(self):
+        """Forgets scanned and parsed languages, e.g. after a language file is installed."""
+        self._available_langs = None
+        self._lang_cache.clear()
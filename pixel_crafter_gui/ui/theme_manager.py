@@ -3,6 +3,27 @@ import os
 import customtkinter as ctk
 import weakref
 
+# Widget class -> how a role's resolved colors are applied to it
+_APPLIERS = {
+    ctk.CTkButton: lambda w, c: w.configure(fg_color=c["base"], hover_color=c["hover"], text_color=c["text"]),
+    ctk.CTkSlider: lambda w, c: w.configure(progress_color=c["base"], button_color=c["base"]),
+    ctk.CTkProgressBar: lambda w, c: w.configure(progress_color=c["base"]),
+    ctk.CTkSwitch: lambda w, c: w.configure(fg_color=c["base"], progress_color=c["base"]),
+    ctk.CTkCheckBox: lambda w, c: w.configure(fg_color=c["base"]),
+    ctk.CTkRadioButton: lambda w, c: w.configure(fg_color=c["base"]),
+    ctk.CTkOptionMenu: lambda w, c: w.configure(fg_color=c["base"], button_color=c["base"], button_hover_color=c["hover"], text_color=c["text"]),
+    ctk.CTkSegmentedButton: lambda w, c: w.configure(selected_color=c["base"], selected_text_color=c["text"]),
+}
+
+def _applier_for(cls):
+    """Finds the applier for cls, walking its MRO once for subclasses and caching the result."""
+    try:
+        return _APPLIERS[cls]
+    except KeyError:
+        fn = next((_APPLIERS[base] for base in cls.__mro__[1:] if base in _APPLIERS), None)
+        _APPLIERS[cls] = fn
+        return fn
+
 class ThemeManager:
     def __init__(self, theme_dir="themes"):
         self.theme_dir = theme_dir
@@ -38,6 +59,9 @@ class ThemeManager:
             }
         }
         
+        # Resolved base/hover/text colors per theme and role, so refreshes do no hex math
+        self._theme_cache = {name: self._build_theme_colors(cfg) for name, cfg in self.theme_configs.items()}
+        
         self.current_theme_name = "Default Dark"
         self._registered_widgets = [] # List of (weakref(widget), role_str)
 
@@ -68,43 +92,49 @@ class ThemeManager:
 
     def _update_single_widget(self, widget, role, theme_name):
         """Applies theme logic to a specific widget based on its role and current theme."""
-        config = self.theme_configs.get(theme_name, self.theme_configs["Default Dark"])
-        base_color = config.get(role, config["accent"])
-        
-        # Determine text color: use override if present, otherwise auto-contrast
-        text_color = config.get("text")
-        if text_color is None:
-            text_color = self.get_contrast_color(base_color)
-            
-        hover_color = self.adjust_brightness(base_color, -0.15)
+        theme = self._theme_cache.get(theme_name) or self._theme_cache["Default Dark"]
+        colors = theme.get(role, theme["accent"])
         
+        fn = _applier_for(type(widget))
+        if fn is None:
+            return
         try:
-            if isinstance(widget, ctk.CTkButton):
-                widget.configure(fg_color=base_color, hover_color=hover_color, text_color=text_color)
-            elif isinstance(widget, (ctk.CTkSlider, ctk.CTkProgressBar)):
-                widget.configure(progress_color=base_color, button_color=base_color if isinstance(widget, ctk.CTkSlider) else None)
-            elif isinstance(widget, (ctk.CTkSwitch, ctk.CTkCheckBox, ctk.CTkRadioButton)):
-                widget.configure(fg_color=base_color, progress_color=base_color if isinstance(widget, ctk.CTkSwitch) else None)
-            elif isinstance(widget, ctk.CTkOptionMenu):
-                widget.configure(fg_color=base_color, button_color=base_color, button_hover_color=hover_color, text_color=text_color)
-            elif isinstance(widget, ctk.CTkSegmentedButton):
-                widget.configure(selected_color=base_color, selected_text_color=text_color)
+            fn(widget, colors)
         except Exception:
             pass
 
+    def _build_theme_colors(self, config):
+        """Resolves every role of a theme config to its base, hover and text colors."""
+        colors = {}
+        for role, base_color in config.items():
+            if role == "text":
+                continue
+            # Determine text color: use override if present, otherwise auto-contrast
+            text_color = config.get("text")
+            if text_color is None:
+                text_color = self.get_contrast_color(base_color)
+            colors[role] = {
+                "base": base_color,
+                "hover": self.adjust_brightness(base_color, -0.15),
+                "text": text_color,
+            }
+        return colors
+
     def get_contrast_color(self, hex_color):
         """Determines if text should be black or white based on background luminance."""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        v = int(hex_color.lstrip('#'), 16)
+        r, g, b = (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
         luminance = (0.2126 * r + 0.7152 * g + 0.0722 * b) / 255
         return "#000000" if luminance > 0.5 else "#FFFFFF"
 
     def adjust_brightness(self, hex_color, factor):
         """Helper to make a color darker or lighter."""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        new_rgb = [max(0, min(255, int(c * (1 + factor)))) for c in rgb]
-        return '#{:02x}{:02x}{:02x}'.format(*new_rgb)
+        v = int(hex_color.lstrip('#'), 16)
+        scale = 1 + factor
+        r = max(0, min(255, int(((v >> 16) & 0xFF) * scale)))
+        g = max(0, min(255, int(((v >> 8) & 0xFF) * scale)))
+        b = max(0, min(255, int((v & 0xFF) * scale)))
+        return f"#{(r << 16) | (g << 8) | b:06x}"
 
     def apply_custom_color(self, role, color):
         """Updates the 'Custom' theme configuration and switches to it."""
@@ -113,6 +143,7 @@ class ThemeManager:
             self.theme_configs["Custom"] = self.theme_configs["Default Dark"].copy()
         
         self.theme_configs["Custom"][role] = color
+        self._theme_cache["Custom"] = self._build_theme_colors(self.theme_configs["Custom"])
         self.current_theme_name = "Custom"
         self.refresh_widgets()
 